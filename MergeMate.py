@@ -3,16 +3,25 @@ MergeMate — File Merger Tool
 Merge multiple text/code files into one organized document.
 """
 
+import codecs
+import io
 import os
-import shutil
-import tempfile
 import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, TextIO, Tuple, Union
 
-import chardet
 import streamlit as st
 
+# Prefer the optional C implementation (faust-cchardet); otherwise use
+# charset_normalizer, which exposes the same ``detect(bytes) -> dict`` API.
+try:
+    import cchardet as _charset_detector
+except ImportError:
+    import charset_normalizer as _charset_detector
+
 # ─── Constants ───────────────────────────────────────────────────────────────
 
 __version__ = "1.1.0"
@@ -28,54 +37,145 @@ TEXT_EXTENSIONS: frozenset[str] = frozenset({
     ".toml", ".env", ".gitignore", ".dockerfile",
 })
 
+# Bare lowercase suffixes for the hot is_text_file() lookup
+_TEXT_SUFFIXES: frozenset[str] = frozenset(ext[1:] for ext in TEXT_EXTENSIONS)
+
 # Streamlit file_uploader expects extensions WITHOUT the leading dot
 UPLOAD_EXTENSIONS: list[str] = [ext.lstrip(".") for ext in sorted(TEXT_EXTENSIONS)]
 
 DEFAULT_SEPARATOR = "\n" + "=" * 80 + "\n"
 
-# How many bytes to sample for encoding detection (64 KB is enough for chardet)
+# How many bytes to sample for encoding detection (64 KB is plenty)
 ENCODING_SAMPLE_BYTES = 65_536
 
+# Every character str.splitlines() treats as a line boundary
+_LINE_BREAKS = frozenset("\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029")
+
+# Upper bound on concurrent file reads during a merge
+MAX_READ_WORKERS = 32
+
+# Byte-order marks recognised without running the detector.  UTF-32 LE must
+# come before UTF-16 LE because its BOM starts with the UTF-16 LE one.
+_BOM_ENCODINGS: tuple[tuple[bytes, str], ...] = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# A merge input: a path on disk, or an in-memory (name, data) pair such as a
+# ZIP archive entry
+FileSource = Union[str, Tuple[str, bytes]]
+
 # ─── Core Utilities ──────────────────────────────────────────────────────────
 
 
-def detect_encoding(file_path: str) -> str:
+def _bom_encoding(raw: bytes) -> Optional[str]:
+    """Return the codec implied by a leading byte-order mark, if any."""
+    for bom, encoding in _BOM_ENCODINGS:
+        if raw.startswith(bom):
+            return encoding
+    return None
+
+
+def _sniff_encoding(sample: bytes) -> str:
     """
-    Detect the encoding of a file by sampling up to ENCODING_SAMPLE_BYTES.
-    Falls back to 'utf-8' on any error.
+    Run the charset detector over *sample*, falling back to 'utf-8'.
+    An 'ascii' verdict only describes the sample, so it is widened to
+    'utf-8', which decodes ASCII identically and also covers the rest.
     """
-    try:
-        with open(file_path, "rb") as fh:
-            raw = fh.read(ENCODING_SAMPLE_BYTES)
-        result = chardet.detect(raw)
-        return result.get("encoding") or "utf-8"
-    except (OSError, IOError):
+    encoding = _charset_detector.detect(sample).get("encoding")
+    if not encoding or encoding.lower() == "ascii":
         return "utf-8"
+    return encoding
+
+
+def _decode_text(raw: bytes, encoding: str, errors: str = "strict") -> str:
+    """
+    Decode *raw* the way a text-mode ``open()`` would, including universal
+    newline translation, so merged output is identical to reading the file.
+    """
+    text = raw.decode(encoding, errors)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def decode_file_content(raw: bytes) -> str:
+    """
+    Decode raw file bytes to text.
+    A BOM or a clean strict UTF-8 decode settles the encoding without the
+    detector; otherwise only the first ENCODING_SAMPLE_BYTES are handed to
+    it.  If the detected codec cannot decode the file strictly, it falls
+    back to UTF-8 with replacement characters, so a wrong guess cannot
+    garble otherwise valid UTF-8.
+    """
+    encoding = _bom_encoding(raw)
+    if encoding is None:
+        try:
+            return _decode_text(raw, "utf-8")
+        except UnicodeDecodeError:
+            encoding = _sniff_encoding(raw[:ENCODING_SAMPLE_BYTES])
+    try:
+        return _decode_text(raw, encoding)
+    except (UnicodeDecodeError, LookupError):
+        return _decode_text(raw, "utf-8", errors="replace")
 
 
 def read_file_content(file_path: str) -> Tuple[str, bool]:
     """
     Read file content with encoding detection.
+    The file is read once, unbuffered, since the whole file is wanted
+    anyway, and decoded with decode_file_content().
     Returns (content, success).  On failure, content is a human-readable
     error message so the caller can embed it in the merged output.
     """
     try:
-        encoding = detect_encoding(file_path)
-        with open(file_path, encoding=encoding) as fh:
-            return fh.read(), True
-    except UnicodeDecodeError:
-        try:
-            with open(file_path, encoding="utf-8", errors="replace") as fh:
-                return fh.read(), True
-        except Exception as exc:  # noqa: BLE001
-            return f"[Error: Could not read file — {exc}]", False
+        with open(file_path, "rb", buffering=0) as fh:
+            raw = fh.readall()
     except Exception as exc:  # noqa: BLE001
         return f"[Error reading {file_path}: {exc}]", False
+    return decode_file_content(raw), True
+
+
+def read_source_content(source: FileSource) -> Tuple[str, bool]:
+    """Like read_file_content(), but also accepts an in-memory (name, data) pair."""
+    if isinstance(source, str):
+        return read_file_content(source)
+    _name, data = source
+    return decode_file_content(data), True
+
+
+def source_name(source: FileSource) -> str:
+    """Return the display filename (no directory part) of a merge input."""
+    name = source if isinstance(source, str) else source[0]
+    return os.path.basename(name)
+
+
+def get_file_info(source: FileSource) -> dict:
+    """
+    Return {'name', 'size', 'exists'} for a merge input.
+    Paths cost a single os.stat(); in-memory data costs none.
+    """
+    name = source_name(source)
+    if not isinstance(source, str):
+        return {"name": name, "size": len(source[1]), "exists": True}
+    try:
+        size = os.stat(source).st_size
+    except OSError:
+        return {"name": name, "size": 0, "exists": False}
+    return {"name": name, "size": size, "exists": True}
 
 
 def is_text_file(file_path: str) -> bool:
     """Return True if *file_path* has a recognised text-based extension."""
-    return Path(file_path).suffix.lower() in TEXT_EXTENSIONS
+    # Plain string split instead of Path(...).suffix: this runs once per
+    # archive entry.  A dot in a directory name leaves a "/" in *ext*, which
+    # can never match.  Unlike Path.suffix, dotfiles such as ".gitignore"
+    # and ".env" are recognised.
+    _stem, dot, ext = file_path.rpartition(".")
+    return bool(dot) and ext.lower() in _TEXT_SUFFIXES
 
 
 def sanitize_filename(name: str) -> str:
@@ -93,102 +193,138 @@ def sanitize_filename(name: str) -> str:
 # ─── File Operations ─────────────────────────────────────────────────────────
 
 
-def merge_files(file_paths: List[str], separator: str = DEFAULT_SEPARATOR) -> str:
-    """Merge multiple files into one string with filename headers."""
-    parts: list[str] = []
-    last_index = len(file_paths) - 1
-
-    for i, file_path in enumerate(file_paths):
-        filename = os.path.basename(file_path)
-        header = f"\n{filename}:\n{'-' * (len(filename) + 1)}\n"
-        parts.append(header)
-
-        content, _ok = read_file_content(file_path)
-        parts.append(content)
-
-        if i < last_index:
-            parts.append(separator)
-
-    return "".join(parts)
+def _read_contents_in_order(sources: List[FileSource]) -> Iterator[Tuple[str, bool]]:
+    """
+    Yield read_source_content() for each source, in order.  When any source
+    is a path, reads run ahead on a thread pool, with at most twice the
+    worker count of results held at once so a streamed merge stays bounded
+    in memory.  Purely in-memory sources are decoded inline: decoding holds
+    the GIL, so threads would only add overhead.
+    """
+    if not any(isinstance(src, str) for src in sources):
+        yield from map(read_source_content, sources)
+        return
+    workers = min(MAX_READ_WORKERS, len(sources))
+    remaining = iter(sources)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque(
+            pool.submit(read_source_content, src) for src in islice(remaining, workers * 2)
+        )
+        while pending:
+            result = pending.popleft().result()
+            next_source = next(remaining, None)
+            if next_source is not None:
+                pending.append(pool.submit(read_source_content, next_source))
+            yield result
 
 
-def save_merged_file(content: str, output_filename: str) -> Tuple[Optional[str], Optional[str]]:
+def merge_files_to(
+    sources: List[FileSource], separator: str, out: TextIO
+) -> Tuple[int, int, int]:
     """
-    Save merged content to a temp file.
-    Returns (file_path, None) on success or (None, error_message) on failure.
-    Caller is responsible for displaying any error.
+    Stream the merge of *sources* (paths or (name, data) pairs) into the
+    text stream *out*.
+
+    Files on disk are read concurrently but written strictly in order, with
+    only a small read-ahead window held in memory.  Returns
+    (total_chars, total_lines, total_words) for the merged text, counted
+    as each chunk is written so the output never has to be re-scanned.
     """
-    output_path = os.path.join(tempfile.gettempdir(), output_filename)
-    try:
-        with open(output_path, "w", encoding="utf-8") as fh:
-            fh.write(content)
-        return output_path, None
-    except Exception as exc:  # noqa: BLE001
-        return None, str(exc)
+    total_chars = total_breaks = total_words = 0
+    last_char = ""
+
+    def write(chunk: str) -> None:
+        nonlocal total_chars, total_breaks, total_words, last_char
+        if not chunk:
+            return
+        out.write(chunk)
+        total_chars += len(chunk)
+        # Line breaks as str.splitlines() sees them: every piece but an
+        # unterminated last one ends in a break
+        total_breaks += len(chunk.splitlines()) - (chunk[-1] not in _LINE_BREAKS)
+        # A "\r\n" split across the chunk boundary is one break, not two
+        if last_char == "\r" and chunk[0] == "\n":
+            total_breaks -= 1
+        total_words += len(chunk.split())
+        # A word running across the chunk boundary was counted twice
+        if last_char and not last_char.isspace() and not chunk[0].isspace():
+            total_words -= 1
+        last_char = chunk[-1]
+
+    contents = _read_contents_in_order(sources)
+    for i, (source, (content, _ok)) in enumerate(zip(sources, contents)):
+        # Separator goes *before* every file but the first
+        if i:
+            write(separator)
+
+        filename = source_name(source)
+        write(f"\n{filename}:\n{'-' * (len(filename) + 1)}\n")
+        write(content)
+
+    # Match len(text.splitlines()): a trailing partial line still counts
+    total_lines = total_breaks + (1 if last_char and last_char not in _LINE_BREAKS else 0)
+    return total_chars, total_lines, total_words
+
+
+def merge_files(sources: List[FileSource], separator: str = DEFAULT_SEPARATOR) -> str:
+    """Merge multiple files into one string with filename headers."""
+    out = io.StringIO()
+    merge_files_to(sources, separator, out)
+    return out.getvalue()
 
 
-def extract_zip_files(zip_file_obj) -> Tuple[List[str], Optional[str]]:
+def extract_zip_files(zip_file_obj) -> Tuple[List[Tuple[str, bytes]], Optional[str]]:
     """
-    Extract text files from an uploaded ZIP archive.
+    Read the text files out of an uploaded ZIP archive, in memory.
 
-    Returns (file_paths, error_message).
-    Includes Zip Slip protection: any entry whose resolved path escapes
-    the temp directory is silently skipped.
+    Returns (entries, error_message), where entries is a list of
+    (member_name, data) pairs sorted by name.  Nothing is written to disk,
+    so hostile member names (Zip Slip) cannot escape anywhere.
     """
-    temp_dir = tempfile.mkdtemp()
-    file_paths: list[str] = []
-
     try:
         with zipfile.ZipFile(zip_file_obj) as zf:
-            # ── Zip Slip protection ──────────────────────────────────────
-            real_temp = os.path.realpath(temp_dir)
-            safe_members: list[str] = []
-            for member in zf.namelist():
-                target = os.path.realpath(os.path.join(real_temp, member))
-                if target.startswith(real_temp + os.sep) or target == real_temp:
-                    safe_members.append(member)
-
-            zf.extractall(temp_dir, members=safe_members)
-
-        for root, _dirs, files in os.walk(temp_dir):
-            for fname in files:
-                full_path = os.path.join(root, fname)
-                if is_text_file(full_path):
-                    file_paths.append(full_path)
-
-        # Store the temp_dir so the caller can clean it up later
-        return sorted(file_paths), None
+            entries = [
+                (info.filename, zf.read(info))
+                for info in zf.infolist()
+                if not info.is_dir() and is_text_file(info.filename)
+            ]
+        return sorted(entries, key=lambda entry: entry[0]), None
 
     except zipfile.BadZipFile:
-        shutil.rmtree(temp_dir, ignore_errors=True)
         return [], "The uploaded file is not a valid ZIP archive."
     except Exception as exc:  # noqa: BLE001
-        shutil.rmtree(temp_dir, ignore_errors=True)
         return [], str(exc)
 
 
-# ─── Session-State Helpers ───────────────────────────────────────────────────
+# ─── Cached Helpers ──────────────────────────────────────────────────────────
 
 
-def _cleanup_temp_files(paths: List[str]) -> None:
-    """Remove a list of temp file paths, ignoring any errors."""
-    for p in paths:
-        try:
-            if os.path.isfile(p):
-                os.remove(p)
-            elif os.path.isdir(p):
-                shutil.rmtree(p, ignore_errors=True)
-        except OSError:
-            pass
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_merge(
+    sources: List[Tuple[str, bytes]], separator: str
+) -> Tuple[bytes, Tuple[int, int, int]]:
+    """
+    Merge in-memory *sources* into UTF-8 bytes and return them with
+    merge_files_to()'s statistics.  Streamlit hashes the bytes, so the cache
+    key tracks the uploaded content itself.
+    """
+    # Stream straight into the UTF-8 buffer; newline="" keeps "\n"
+    # untranslated on every platform
+    merged = io.BytesIO()
+    writer = io.TextIOWrapper(merged, encoding="utf-8", newline="")
+    stats = merge_files_to(sources, separator, writer)
+    writer.detach()
+    return merged.getvalue(), stats
+
+
+# ─── Session-State Helpers ───────────────────────────────────────────────────
 
 
 def _init_session_state() -> None:
     """Ensure all required session-state keys exist."""
     defaults = {
-        "temp_individual_files": [],   # paths written for individual uploads
-        "zip_temp_dir": None,          # temp dir created for ZIP extraction
-        "zip_file_paths": [],          # extracted paths from last ZIP
-        "zip_excluded": set(),         # basenames the user has excluded
+        "zip_entries": [],             # (member_name, data) from last ZIP
+        "zip_excluded": set(),         # member names the user has excluded
         "last_upload_method": None,
     }
     for key, val in defaults.items():
@@ -234,10 +370,11 @@ def _render_sidebar() -> Tuple[str, str]:
     return output_filename, separator
 
 
-def _render_upload_section() -> List[str]:
+def _render_upload_section() -> List[Tuple[str, bytes]]:
     """
-    Render upload controls and return the final list of file paths to merge.
-    Manages session-state so temp files are written only when uploads change.
+    Render upload controls and return the final list of sources to merge.
+    Uploads are merged straight from memory; session-state ensures a ZIP
+    archive is only read when a new one is uploaded.
     """
     upload_method = st.radio(
         "Choose upload method",
@@ -247,16 +384,12 @@ def _render_upload_section() -> List[str]:
 
     # Reset state when the method changes
     if st.session_state.last_upload_method != upload_method:
-        _cleanup_temp_files(st.session_state.temp_individual_files)
-        if st.session_state.zip_temp_dir:
-            _cleanup_temp_files([st.session_state.zip_temp_dir])
-        st.session_state.temp_individual_files = []
-        st.session_state.zip_temp_dir = None
-        st.session_state.zip_file_paths = []
+        st.session_state.zip_entries = []
         st.session_state.zip_excluded = set()
+        st.session_state.pop("_zip_cache_key", None)
         st.session_state.last_upload_method = upload_method
 
-    file_paths: list[str] = []
+    sources: list[Tuple[str, bytes]] = []
 
     # ── Individual Files ─────────────────────────────────────────────────────
     if upload_method == "Individual Files":
@@ -267,82 +400,64 @@ def _render_upload_section() -> List[str]:
         )
 
         if uploaded_files:
-            # Re-write only when the set of filenames changes
-            current_names = {f.name for f in uploaded_files}
-            existing_names = {os.path.basename(p) for p in st.session_state.temp_individual_files}
-
-            if current_names != existing_names:
-                _cleanup_temp_files(st.session_state.temp_individual_files)
-                st.session_state.temp_individual_files = []
-                tmp = tempfile.gettempdir()
-                for uf in uploaded_files:
-                    dest = os.path.join(tmp, uf.name)
-                    with open(dest, "wb") as fh:
-                        fh.write(uf.getbuffer())
-                    st.session_state.temp_individual_files.append(dest)
-
-            file_paths = list(st.session_state.temp_individual_files)
+            # UploadedFile is already an in-memory buffer; no temp copies
+            sources = [(uf.name, uf.getvalue()) for uf in uploaded_files]
 
     # ── ZIP Archive ──────────────────────────────────────────────────────────
     else:
         zip_file = st.file_uploader("Upload ZIP archive", type=["zip"])
 
         if zip_file:
-            # Re-extract only when a new ZIP is uploaded (detect by filename)
+            # Re-read only when a new ZIP is uploaded (detect by filename)
             zip_name = getattr(zip_file, "name", None)
-            already_extracted = bool(st.session_state.zip_file_paths)
 
             # Use the file size + name as a simple change detector
             cache_key = f"{zip_name}_{zip_file.size}"
             if st.session_state.get("_zip_cache_key") != cache_key:
-                if st.session_state.zip_temp_dir:
-                    _cleanup_temp_files([st.session_state.zip_temp_dir])
-                with st.spinner("Extracting ZIP archive…"):
-                    paths, err = extract_zip_files(zip_file)
+                with st.spinner("Reading ZIP archive…"):
+                    entries, err = extract_zip_files(zip_file)
                 if err:
                     st.error(f"❌ {err}")
-                    paths = []
-                st.session_state.zip_file_paths = paths
+                    entries = []
+                st.session_state.zip_entries = entries
                 st.session_state.zip_excluded = set()
-                # Store the temp_dir for later cleanup
-                if paths:
-                    st.session_state.zip_temp_dir = os.path.dirname(paths[0])
                 st.session_state["_zip_cache_key"] = cache_key
 
-            all_paths = st.session_state.zip_file_paths
+            all_entries = st.session_state.zip_entries
 
-            if all_paths:
-                st.markdown(f"**{len(all_paths)} text file(s) found in archive**")
+            if all_entries:
+                st.markdown(f"**{len(all_entries)} text file(s) found in archive**")
                 with st.expander("Select files to include", expanded=True):
-                    for p in all_paths:
-                        bname = os.path.basename(p)
-                        checked = bname not in st.session_state.zip_excluded
-                        if not st.checkbox(bname, value=checked, key=f"zip_chk_{bname}"):
-                            st.session_state.zip_excluded.add(bname)
+                    for name, _data in all_entries:
+                        checked = name not in st.session_state.zip_excluded
+                        if not st.checkbox(name, value=checked, key=f"zip_chk_{name}"):
+                            st.session_state.zip_excluded.add(name)
                         else:
-                            st.session_state.zip_excluded.discard(bname)
+                            st.session_state.zip_excluded.discard(name)
 
-                file_paths = [
-                    p for p in all_paths
-                    if os.path.basename(p) not in st.session_state.zip_excluded
+                sources = [
+                    entry for entry in all_entries
+                    if entry[0] not in st.session_state.zip_excluded
                 ]
 
-    return file_paths
+    return sources
 
 
-def _render_file_list(file_paths: List[str]) -> None:
+def _render_file_list(sources: List[FileSource]) -> None:
     """Display a table of selected files with size info."""
-    with st.expander(f"📋 {len(file_paths)} file(s) queued for merge", expanded=False):
+    with st.expander(f"📋 {len(sources)} file(s) queued for merge", expanded=False):
         rows = []
-        for i, fp in enumerate(file_paths, 1):
-            bname = os.path.basename(fp)
-            size = os.path.getsize(fp) if os.path.isfile(fp) else 0
-            rows.append({"#": i, "Filename": bname, "Size": f"{size:,} bytes"})
+        for i, src in enumerate(sources, 1):
+            info = get_file_info(src)
+            rows.append({"#": i, "Filename": info["name"], "Size": f"{info['size']:,} bytes"})
         st.table(rows)
 
 
-def _render_merge_results(merged_content: str, output_filename: str) -> None:
+def _render_merge_results(
+    merged: bytes, stats: Tuple[int, int, int], output_filename: str
+) -> None:
     """Render the success banner, preview, download button, and stats."""
+    total_chars, total_lines, total_words = stats
     st.success("✅ Files merged successfully!")
 
     # ── Preview ──────────────────────────────────────────────────────────────
@@ -350,31 +465,31 @@ def _render_merge_results(merged_content: str, output_filename: str) -> None:
     preview_chars = st.slider(
         "Preview length (characters)", 500, 5_000, 1_000, step=500
     )
-    truncated = len(merged_content) > preview_chars
-    preview_text = merged_content[:preview_chars] + ("…" if truncated else "")
+    # Decode just enough of the UTF-8 output (≤ 4 bytes per character)
+    head = merged[: preview_chars * 4]
+    truncated = total_chars > preview_chars
+    preview_text = head.decode("utf-8", errors="ignore")[:preview_chars]
+    preview_text += "…" if truncated else ""
     st.text_area("Merged content preview", value=preview_text, height=250, disabled=True)
 
     # ── Download ─────────────────────────────────────────────────────────────
     st.download_button(
         label="📥 Download Merged File",
-        data=merged_content.encode("utf-8"),
+        data=merged,
         file_name=output_filename,
         mime="text/plain",
         use_container_width=True,
     )
 
     # ── Statistics ────────────────────────────────────────────────────────────
-    total_lines = len(merged_content.splitlines())  # accurate for \r\n and \n
-    total_words = len(merged_content.split())
     c1, c2, c3 = st.columns(3)
-    c1.metric("Total Characters", f"{len(merged_content):,}")
+    c1.metric("Total Characters", f"{total_chars:,}")
     c2.metric("Total Lines", f"{total_lines:,}")
     c3.metric("Total Words", f"{total_words:,}")
 
 
-def _render_how_to_use() -> None:
-    with st.expander("ℹ️ How to use", expanded=False):
-        st.markdown(f"""
+# Static help text for the "How to use" expander
+_HOW_TO_USE_MD = f"""
 ### Instructions
 1. **Choose upload method** — select individual files or a ZIP archive.
 2. **Upload files** — use the file uploader to select your text files.
@@ -403,7 +518,12 @@ Programming, web, config, and documentation files including
 
 ### Version
 MergeMate v{__version__}
-        """)
+"""
+
+
+def _render_how_to_use() -> None:
+    with st.expander("ℹ️ How to use", expanded=False):
+        st.markdown(_HOW_TO_USE_MD)
 
 
 def main() -> None:
@@ -425,22 +545,18 @@ def main() -> None:
 
     # ── Upload section ────────────────────────────────────────────────────────
     st.subheader("Upload Files")
-    file_paths = _render_upload_section()
+    sources = _render_upload_section()
 
     # ── File list & merge action ──────────────────────────────────────────────
-    if file_paths:
-        st.success(f"📁 {len(file_paths)} file(s) ready to merge")
-        _render_file_list(file_paths)
+    if sources:
+        st.success(f"📁 {len(sources)} file(s) ready to merge")
+        _render_file_list(sources)
 
         if st.button("🔗 Merge Files", type="primary", use_container_width=True):
             with st.spinner("Merging files…"):
-                merged_content = merge_files(file_paths, separator)
-                _output_path, err = save_merged_file(merged_content, output_filename)
+                merged, stats = _cached_merge(sources, separator)
 
-            if err:
-                st.error(f"❌ Error saving merged file: {err}")
-            else:
-                _render_merge_results(merged_content, output_filename)
+            _render_merge_results(merged, stats, output_filename)
 
     else:
         st.info("👆 Please upload files to begin merging")